@@ -0,0 +1,107 @@
+"""
+Query Cache Helpers
+
+Redis-backed cache for serialized query results. Each namespace (usually
+the collection name) carries a version counter, bumped on every write, and
+entries are keyed by namespace + version + a hash of the filter. A write
+therefore orphans every cached query for its namespace in O(1); the stale
+entries simply expire by TTL. The version doubles as the list ETag.
+All helpers are no-ops when REDIS_URL is not set, and best-effort when it
+is: Redis errors are logged and treated as a miss, so reads fall back to
+Mongo and writes still succeed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+redis_client = None
+
+redis_url = os.getenv("REDIS_URL")
+CACHE_TTL = int(os.getenv("CACHE_TTL", 30))
+# Version keys expire so a bump lost to a Redis error heals on its own: the
+# key is re-seeded from the clock, which is always ahead of the old value, so
+# stale ETags stop matching within this window instead of lasting until the
+# next successful write.
+VERSION_TTL = int(os.getenv("VERSION_TTL", 10 * CACHE_TTL))
+
+if redis_url:
+    redis_client = Redis.from_url(redis_url)
+
+
+def make_key(namespace: str, version: str, filter_dict: Dict[str, Any] = None) -> str:
+    """Build a stable cache key for a namespace version + filter"""
+    digest = hashlib.blake2b(
+        json.dumps(filter_dict or {}, sort_keys=True, default=str).encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f"{namespace}:{version}:{digest}"
+
+
+def _version_key(namespace: str) -> str:
+    return f"ver:{namespace}"
+
+
+async def get_version(namespace: str) -> Optional[str]:
+    """Return the current write version of a namespace, or None when the cache is unavailable"""
+    if redis_client is None:
+        return None
+    # Seeded from the clock so a flushed or expired key never reissues an old
+    # version. Reads don't extend the expiry; see VERSION_TTL.
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set(_version_key(namespace), time.time_ns(), nx=True, ex=VERSION_TTL)
+        pipe.get(_version_key(namespace))
+        _, version = await pipe.execute()
+    except RedisError as e:
+        logger.warning("cache version read failed for %s: %s", namespace, e)
+        return None
+    return version.decode()
+
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """Return the cached payload for key, or None on a miss"""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except RedisError as e:
+        logger.warning("cache get failed for %s: %s", key, e)
+        return None
+
+
+async def set_cached(key: str, payload: bytes, ttl: int = CACHE_TTL):
+    """Store a serialized payload with a TTL"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, ttl, payload)
+    except RedisError as e:
+        logger.warning("cache set failed for %s: %s", key, e)
+
+
+async def invalidate(*namespaces: str):
+    """Bump the versions of the given namespaces, orphaning their cached entries"""
+    if redis_client is None:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for namespace in namespaces:
+            pipe.set(_version_key(namespace), time.time_ns(), nx=True, ex=VERSION_TTL)
+            pipe.incr(_version_key(namespace))
+            pipe.expire(_version_key(namespace), VERSION_TTL)
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning("cache invalidation failed for %s: %s", ", ".join(namespaces), e)
@@ -1,21 +1,38 @@
+import logging
 import os
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+import secrets
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+import ciso8601
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
-from database import create_document, get_documents, db
+from cache import CACHE_TTL, get_cached, get_version, invalidate, make_key, set_cached
+from database import create_document, create_documents, get_documents, db
 from schemas import User, Workspace, Room, Meeting, Note, Task
 
 
-app = FastAPI(title="Qik Office API", version="0.1.0")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Qik Office API", version="0.1.0", default_response_class=ORJSONResponse)
+
+# Comma-separated list, e.g. "https://app.example.com,https://admin.example.com";
+# unset falls back to "*" for local development. Starlette keeps allow_origins
+# as given and checks `origin in allow_origins`, so a frozenset makes that
+# membership test O(1) rather than a scan of the list.
+ALLOWED_ORIGINS = frozenset(o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()) or frozenset({"*"})
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_origin_regex=None,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -29,66 +46,207 @@ app.add_middleware(
 def serialize_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
     if not doc:
         return doc
-    d = doc.copy()
-    if "_id" in d:
-        d["id"] = str(d.pop("_id"))
-    # Convert datetimes to isoformat strings
-    for k, v in list(d.items()):
-        try:
-            import datetime as _dt
-            if isinstance(v, (_dt.datetime, _dt.date)):
-                d[k] = v.isoformat()
-        except Exception:
-            pass
-    return d
+    # Single pass, no intermediate copy; datetimes are left for orjson to encode
+    return {("id" if k == "_id" else k): (str(v) if k == "_id" else v) for k, v in doc.items()}
 
 
 def serialize_list(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return [serialize_doc(i) for i in items]
 
 
+def parse_datetime(value: str) -> datetime:
+    try:
+        return ciso8601.parse_datetime(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid datetime: {value}")
+
+
+def json_response(payload: bytes) -> Response:
+    return Response(content=payload, media_type="application/json")
+
+
+# ----------------------------
+# Response models
+# ----------------------------
+
+class IdResponse(BaseModel):
+    id: str
+
+
+class BulkWriteErrorItem(BaseModel):
+    index: int
+    code: Optional[int] = None
+    message: Optional[str] = None
+
+
+class IdsResponse(BaseModel):
+    ids: List[str]
+    errors: List[BulkWriteErrorItem] = []
+
+
+# Upper bound on items per bulk request. Validation and model construction
+# for the whole batch run on the event loop before any I/O, so an unbounded
+# list would stall the worker; 1000 keeps that to a few milliseconds while
+# still covering typical imports (split larger ones client-side).
+MAX_BULK_ITEMS = 1000
+
+
+# ----------------------------
+# Cached reads
+# ----------------------------
+
+async def cached_get(coll: str, filter_q: Dict[str, Any], version: Optional[str], ttl: int = CACHE_TTL) -> bytes:
+    # Serialized JSON is cached, so hits skip Mongo and serialize_doc entirely;
+    # without a version the cache is unavailable and Mongo is read directly
+    if version is None:
+        return orjson.dumps(serialize_list(await get_documents(coll, filter_q)))
+    key = make_key(coll, version, filter_q)
+    payload = await get_cached(key)
+    if payload is None:
+        items = await get_documents(coll, filter_q)
+        payload = orjson.dumps(serialize_list(items))
+        await set_cached(key, payload, ttl)
+    return payload
+
+
+async def versioned_get(request: Request, coll: str, filter_q: Dict[str, Any]) -> Response:
+    # The ETag is the collection's write version, read before the data so a
+    # concurrent write can only make the tag older, never newer than the body.
+    # Keying the cache entry on it too keeps the two from drifting apart.
+    version = await get_version(coll)
+    if version is None:
+        return json_response(await cached_get(coll, filter_q, None))
+    etag = f'W/"{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response = json_response(await cached_get(coll, filter_q, version))
+    response.headers["ETag"] = etag
+    return response
+
+
+STREAM_CHUNK_DOCS = 100
+# Results larger than this are streamed but not cached, so memory stays
+# bounded by the chunk size even when Redis is configured.
+STREAM_CACHE_MAX_BYTES = int(os.getenv("STREAM_CACHE_MAX_BYTES", 1024 * 1024))
+
+
+async def stream_documents(coll: str, filter_q: Dict[str, Any], key: Optional[str], ttl: int = CACHE_TTL) -> AsyncIterator[bytes]:
+    # Encodes documents as the cursor advances instead of materializing the
+    # whole result; chunks are only retained while they fit the cache cap.
+    cached: Optional[List[bytes]] = [] if key is not None else None
+    cached_bytes = 0
+    buf: List[bytes] = []
+    first = True
+
+    def retain(chunk: bytes):
+        nonlocal cached, cached_bytes
+        if cached is None:
+            return
+        cached_bytes += len(chunk)
+        if cached_bytes > STREAM_CACHE_MAX_BYTES:
+            cached = None
+        else:
+            cached.append(chunk)
+
+    async for doc in db[coll].find(filter_q):
+        buf.append(orjson.dumps(serialize_doc(doc)))
+        if len(buf) >= STREAM_CHUNK_DOCS:
+            chunk = (b"[" if first else b",") + b",".join(buf)
+            first = False
+            buf = []
+            retain(chunk)
+            yield chunk
+    chunk = (b"[" if first else b"," if buf else b"") + b",".join(buf) + b"]"
+    retain(chunk)
+    # Finish the response before touching the cache so a cache failure can
+    # never truncate the body
+    yield chunk
+    if cached is not None:
+        try:
+            await set_cached(key, b"".join(cached), ttl)
+        except Exception as e:
+            logger.warning("caching streamed %s result failed: %s", coll, e)
+
+
+async def cached_stream(coll: str, filter_q: Dict[str, Any]) -> Response:
+    version = await get_version(coll)
+    key = make_key(coll, version, filter_q) if version is not None else None
+    if key is not None:
+        payload = await get_cached(key)
+        if payload is not None:
+            return json_response(payload)
+    return StreamingResponse(stream_documents(coll, filter_q, key), media_type="application/json")
+
+
+# ----------------------------
+# Startup
+# ----------------------------
+
+DB_DIAGNOSTICS = os.getenv("DB_DIAGNOSTICS", "").lower() in ("1", "true", "yes")
+
+
+@app.on_event("startup")
+async def check_database():
+    # Handlers assume a live handle, so refuse to start without one
+    assert db is not None, "DATABASE_URL / DATABASE_NAME unset"
+    await db.command("ping")
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    # One index per foreign key the list endpoints filter on; create_index is
+    # a no-op when the index already exists.
+    await db["workspace"].create_index("owner_user_id")
+    await db["room"].create_index("workspace_id")
+    await db["meeting"].create_index("room_id")
+    await db["note"].create_index("meeting_id")
+    # Also lets the dashboard task counts run as covered index scans
+    await db["task"].create_index([("meeting_id", 1), ("status", 1)])
+    await db["task"].create_index("assignee_user_id")
+    # Unique indexes fail to build over existing duplicates; log and keep
+    # booting rather than let one bad row block every worker.
+    for field, opts in (("email", {}), ("api_key", {"sparse": True})):
+        try:
+            await db["user"].create_index(field, unique=True, **opts)
+        except OperationFailure as e:
+            logger.warning("skipping unique index on user.%s: %s", field, e)
+
+
 # ----------------------------
 # Health + Schema endpoints
 # ----------------------------
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"app": "Qik Office API", "status": "ok"}
 
 
 @app.get("/test")
-def test_database():
+async def test_database():
+    # The startup hook has already pinged the database
     response = {
         "backend": "✅ Running",
-        "database": "❌ Not Available",
-        "database_url": None,
-        "database_name": None,
-        "connection_status": "Not Connected",
+        "database": "✅ Available",
+        "database_url": "✅ Set",
+        "database_name": db.name,
+        "connection_status": "Connected",
         "collections": []
     }
+    if not DB_DIAGNOSTICS:
+        return response
 
     try:
-        if db is not None:
-            response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = db.name if hasattr(db, 'name') else "✅ Connected"
-            response["connection_status"] = "Connected"
-            try:
-                collections = db.list_collection_names()
-                response["collections"] = collections[:10]
-                response["database"] = "✅ Connected & Working"
-            except Exception as e:
-                response["database"] = f"⚠️ Connected but Error: {str(e)[:80]}"
-        else:
-            response["database"] = "⚠️ Available but not initialized"
+        collections = await db.list_collection_names()
+        response["collections"] = collections[:10]
+        response["database"] = "✅ Connected & Working"
     except Exception as e:
-        response["database"] = f"❌ Error: {str(e)[:80]}"
+        response["database"] = f"⚠️ Connected but Error: {str(e)[:80]}"
 
     return response
 
 
 @app.get("/schema")
-def get_schema():
+async def get_schema():
     # Minimal schema description for viewer/tools
     return {
         "collections": [
@@ -102,17 +260,22 @@ def get_schema():
 # ----------------------------
 
 class SignupRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     name: str
     email: str
     company: Optional[str] = None
 
 
 @app.post("/api/signup")
-def signup(req: SignupRequest):
+async def signup(req: SignupRequest):
     # Generate a very simple API key for the MVP
-    api_key = uuid4().hex
+    api_key = secrets.token_urlsafe(24)
     user = User(name=req.name, email=req.email, company=req.company, api_key=api_key)
-    user_id = create_document("user", user)
+    try:
+        user_id = await create_document("user", user)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Email already registered")
     return {"id": user_id, "api_key": api_key}
 
 
@@ -121,25 +284,25 @@ def signup(req: SignupRequest):
 # ----------------------------
 
 class CreateWorkspaceRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     name: str
     owner_user_id: str
     description: Optional[str] = None
 
 
-@app.post("/api/workspaces")
-def create_workspace(req: CreateWorkspaceRequest):
+@app.post("/api/workspaces", response_model=IdResponse)
+async def create_workspace(req: CreateWorkspaceRequest):
     ws = Workspace(name=req.name, owner_user_id=req.owner_user_id, description=req.description)
-    ws_id = create_document("workspace", ws)
+    ws_id = await create_document("workspace", ws)
+    await invalidate("workspace")
     return {"id": ws_id}
 
 
-@app.get("/api/workspaces")
-def list_workspaces(owner_user_id: Optional[str] = None):
-    filter_q: Dict[str, Any] = {}
-    if owner_user_id:
-        filter_q["owner_user_id"] = owner_user_id
-    items = get_documents("workspace", filter_q)
-    return serialize_list(items)
+@app.get("/api/workspaces", response_model=None)
+async def list_workspaces(request: Request, owner_user_id: Optional[str] = None):
+    filter_q: Dict[str, Any] = {"owner_user_id": owner_user_id} if owner_user_id else {}
+    return await versioned_get(request, "workspace", filter_q)
 
 
 # ----------------------------
@@ -147,28 +310,46 @@ def list_workspaces(owner_user_id: Optional[str] = None):
 # ----------------------------
 
 class CreateRoomRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     workspace_id: str
     name: str
     type: Optional[str] = "online"  # online | in-person | hybrid
     description: Optional[str] = None
 
 
-@app.post("/api/rooms")
-def create_room(req: CreateRoomRequest):
-    room = Room(
+class BulkRoomsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[CreateRoomRequest] = Field(..., max_length=MAX_BULK_ITEMS)
+
+
+def build_room(req: CreateRoomRequest) -> Room:
+    return Room(
         workspace_id=req.workspace_id,
         name=req.name,
         type=req.type or "online",
         description=req.description,
     )
-    room_id = create_document("room", room)
+
+
+@app.post("/api/rooms", response_model=IdResponse)
+async def create_room(req: CreateRoomRequest):
+    room_id = await create_document("room", build_room(req))
+    await invalidate("room", "dashboard")
     return {"id": room_id}
 
 
-@app.get("/api/rooms")
-def list_rooms(workspace_id: str):
-    items = get_documents("room", {"workspace_id": workspace_id})
-    return serialize_list(items)
+@app.post("/api/rooms/bulk", response_model=IdsResponse)
+async def bulk_create_rooms(req: BulkRoomsRequest):
+    ids, errors = await create_documents("room", [build_room(i) for i in req.items])
+    await invalidate("room", "dashboard")
+    return {"ids": ids, "errors": errors}
+
+
+@app.get("/api/rooms", response_model=None)
+async def list_rooms(request: Request, workspace_id: str):
+    return await versioned_get(request, "room", {"workspace_id": workspace_id})
 
 
 # ----------------------------
@@ -176,6 +357,8 @@ def list_rooms(workspace_id: str):
 # ----------------------------
 
 class CreateMeetingRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     room_id: str
     title: str
     scheduled_at: str  # ISO datetime string for simplicity in MVP
@@ -184,11 +367,15 @@ class CreateMeetingRequest(BaseModel):
     participant_user_ids: List[str] = []
 
 
-@app.post("/api/meetings")
-def create_meeting(req: CreateMeetingRequest):
-    from datetime import datetime
-    scheduled_dt = datetime.fromisoformat(req.scheduled_at)
-    mtg = Meeting(
+class BulkMeetingsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[CreateMeetingRequest] = Field(..., max_length=MAX_BULK_ITEMS)
+
+
+def build_meeting(req: CreateMeetingRequest) -> Meeting:
+    scheduled_dt = parse_datetime(req.scheduled_at)
+    return Meeting(
         room_id=req.room_id,
         title=req.title,
         scheduled_at=scheduled_dt,
@@ -196,15 +383,26 @@ def create_meeting(req: CreateMeetingRequest):
         host_user_id=req.host_user_id,
         participant_user_ids=req.participant_user_ids,
     )
-    meeting_id = create_document("meeting", mtg)
+
+
+@app.post("/api/meetings", response_model=IdResponse)
+async def create_meeting(req: CreateMeetingRequest):
+    meeting_id = await create_document("meeting", build_meeting(req))
+    await invalidate("meeting", "dashboard")
     return {"id": meeting_id}
 
 
-@app.get("/api/meetings")
-def list_meetings(room_id: Optional[str] = None):
+@app.post("/api/meetings/bulk", response_model=IdsResponse)
+async def bulk_create_meetings(req: BulkMeetingsRequest):
+    ids, errors = await create_documents("meeting", [build_meeting(i) for i in req.items])
+    await invalidate("meeting", "dashboard")
+    return {"ids": ids, "errors": errors}
+
+
+@app.get("/api/meetings", response_model=None)
+async def list_meetings(request: Request, room_id: Optional[str] = None):
     q: Dict[str, Any] = {"room_id": room_id} if room_id else {}
-    items = get_documents("meeting", q)
-    return serialize_list(items)
+    return await versioned_get(request, "meeting", q)
 
 
 # ----------------------------
@@ -212,22 +410,40 @@ def list_meetings(room_id: Optional[str] = None):
 # ----------------------------
 
 class CreateNoteRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     meeting_id: str
     author_user_id: str
     content: str
 
 
-@app.post("/api/notes")
-def create_note(req: CreateNoteRequest):
-    note = Note(meeting_id=req.meeting_id, author_user_id=req.author_user_id, content=req.content)
-    note_id = create_document("note", note)
+class BulkNotesRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[CreateNoteRequest] = Field(..., max_length=MAX_BULK_ITEMS)
+
+
+def build_note(req: CreateNoteRequest) -> Note:
+    return Note(meeting_id=req.meeting_id, author_user_id=req.author_user_id, content=req.content)
+
+
+@app.post("/api/notes", response_model=IdResponse)
+async def create_note(req: CreateNoteRequest):
+    note_id = await create_document("note", build_note(req))
+    await invalidate("note")
     return {"id": note_id}
 
 
-@app.get("/api/notes")
-def list_notes(meeting_id: str):
-    items = get_documents("note", {"meeting_id": meeting_id})
-    return serialize_list(items)
+@app.post("/api/notes/bulk", response_model=IdsResponse)
+async def bulk_create_notes(req: BulkNotesRequest):
+    ids, errors = await create_documents("note", [build_note(i) for i in req.items])
+    await invalidate("note")
+    return {"ids": ids, "errors": errors}
+
+
+@app.get("/api/notes", response_model=None)
+async def list_notes(meeting_id: str):
+    return await cached_stream("note", {"meeting_id": meeting_id})
 
 
 # ----------------------------
@@ -235,87 +451,154 @@ def list_notes(meeting_id: str):
 # ----------------------------
 
 class CreateTaskRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     meeting_id: str
     title: str
     assignee_user_id: Optional[str] = None
     due_date: Optional[str] = None  # ISO date
 
 
-@app.post("/api/tasks")
-def create_task(req: CreateTaskRequest):
-    from datetime import datetime
-    due_dt = datetime.fromisoformat(req.due_date) if req.due_date else None
-    task = Task(meeting_id=req.meeting_id, title=req.title, assignee_user_id=req.assignee_user_id, due_date=due_dt)
-    task_id = create_document("task", task)
+class BulkTasksRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[CreateTaskRequest] = Field(..., max_length=MAX_BULK_ITEMS)
+
+
+def build_task(req: CreateTaskRequest) -> Task:
+    due_dt = parse_datetime(req.due_date) if req.due_date else None
+    return Task(meeting_id=req.meeting_id, title=req.title, assignee_user_id=req.assignee_user_id, due_date=due_dt)
+
+
+@app.post("/api/tasks", response_model=IdResponse)
+async def create_task(req: CreateTaskRequest):
+    task_id = await create_document("task", build_task(req))
+    await invalidate("task", "dashboard")
     return {"id": task_id}
 
 
-@app.get("/api/tasks")
-def list_tasks(meeting_id: Optional[str] = None, assignee_user_id: Optional[str] = None):
-    q: Dict[str, Any] = {}
-    if meeting_id:
-        q["meeting_id"] = meeting_id
-    if assignee_user_id:
-        q["assignee_user_id"] = assignee_user_id
-    items = get_documents("task", q)
-    return serialize_list(items)
+@app.post("/api/tasks/bulk", response_model=IdsResponse)
+async def bulk_create_tasks(req: BulkTasksRequest):
+    ids, errors = await create_documents("task", [build_task(i) for i in req.items])
+    await invalidate("task", "dashboard")
+    return {"ids": ids, "errors": errors}
+
+
+# Filter builders keyed by which optional query params are set
+_LIST_TASKS_DISPATCH = {
+    (True, True): lambda m, a: {"meeting_id": m, "assignee_user_id": a},
+    (True, False): lambda m, a: {"meeting_id": m},
+    (False, True): lambda m, a: {"assignee_user_id": a},
+    (False, False): lambda m, a: {},
+}
+
+
+@app.get("/api/tasks", response_model=None)
+async def list_tasks(meeting_id: Optional[str] = None, assignee_user_id: Optional[str] = None):
+    q = _LIST_TASKS_DISPATCH[(bool(meeting_id), bool(assignee_user_id))](meeting_id, assignee_user_id)
+    return await cached_stream("task", q)
 
 
 # Simple update endpoint for task status
 class UpdateTaskStatusRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     status: str  # open | in_progress | done
 
 
 @app.patch("/api/tasks/{task_id}/status")
-def update_task_status(task_id: str, body: UpdateTaskStatusRequest):
-    if db is None:
-        raise HTTPException(status_code=500, detail="Database not available")
-    try:
-        oid = ObjectId(task_id)
-    except Exception:
+async def update_task_status(task_id: str, body: UpdateTaskStatusRequest):
+    if not ObjectId.is_valid(task_id):
         raise HTTPException(status_code=400, detail="Invalid task id")
-    res = db["task"].update_one({"_id": oid}, {"$set": {"status": body.status}})
-    if res.matched_count == 0:
+    oid = ObjectId(task_id)
+    # Match check and update in one round-trip
+    doc = await db["task"].find_one_and_update(
+        {"_id": oid},
+        {"$set": {"status": body.status}},
+        projection={"_id": 1, "status": 1},
+        upsert=False,
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return {"id": task_id, "status": body.status}
+    await invalidate("task", "dashboard")
+    return {"id": str(doc["_id"]), "status": doc["status"]}
 
 
 # ----------------------------
 # Dashboard summary
 # ----------------------------
 
-@app.get("/api/dashboard/summary")
-def dashboard_summary(workspace_id: str):
-    if db is None:
-        raise HTTPException(status_code=500, detail="Database not available")
-    # Rooms in workspace
-    rooms = list(db["room"].find({"workspace_id": workspace_id}, {"_id": 1}))
-    room_ids = [str(r["_id"]) for r in rooms]
-
-    # Meetings in rooms
-    meetings = []
-    if room_ids:
-        meetings = list(db["meeting"].find({"room_id": {"$in": room_ids}}, {"_id": 1}))
-    meeting_ids = [str(m.get("_id")) for m in meetings]
-
-    # Tasks and completion
-    q_tasks: Dict[str, Any] = {}
-    if meeting_ids:
-        q_tasks["meeting_id"] = {"$in": meeting_ids}
-    tasks = list(db["task"].find(q_tasks))
-    total_tasks = len(tasks)
-    done_tasks = sum(1 for t in tasks if t.get("status") == "done")
+async def compute_dashboard_summary(workspace_id: str) -> Dict[str, Any]:
+    # Single round-trip: rooms -> meetings -> tasks joined server-side.
+    # Foreign keys are stored as strings, so ObjectIds are stringified first.
+    pipeline = [
+        {"$match": {"workspace_id": workspace_id}},
+        {"$project": {"_id": 0, "room_id": {"$toString": "$_id"}}},
+        # Only meeting _ids are needed downstream, so the join projects everything else away
+        {"$lookup": {
+            "from": "meeting",
+            "let": {"rid": "$room_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$room_id", "$$rid"]}}},
+                {"$project": {"_id": 1}},
+            ],
+            "as": "mtgs",
+        }},
+        {"$unwind": {"path": "$mtgs", "preserveNullAndEmptyArrays": True}},
+        {"$addFields": {"meeting_id": {"$toString": "$mtgs._id"}}},
+        {"$lookup": {
+            "from": "task",
+            "let": {"mid": "$meeting_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$meeting_id", "$$mid"]}}},
+                # Count inside the join so task documents never leave the index scan
+                {"$group": {
+                    "_id": None,
+                    "total": {"$sum": 1},
+                    "done": {"$sum": {"$cond": [{"$eq": ["$status", "done"]}, 1, 0]}},
+                }},
+            ],
+            "as": "task_counts",
+        }},
+        {"$unwind": {"path": "$task_counts", "preserveNullAndEmptyArrays": True}},
+        {"$group": {
+            "_id": None,
+            "rooms": {"$addToSet": "$room_id"},
+            "meetings": {"$sum": {"$cond": [{"$ifNull": ["$mtgs._id", False]}, 1, 0]}},
+            "tasks": {"$sum": "$task_counts.total"},
+            "tasks_done": {"$sum": "$task_counts.done"},
+        }},
+    ]
+    result = await db["room"].aggregate(pipeline).to_list(length=1)
+    counts = result[0] if result else {"rooms": [], "meetings": 0, "tasks": 0, "tasks_done": 0}
+    total_tasks = counts["tasks"]
+    done_tasks = counts["tasks_done"]
 
     return {
-        "rooms": len(rooms),
-        "meetings": len(meetings),
+        "rooms": len(counts["rooms"]),
+        "meetings": counts["meetings"],
         "tasks": total_tasks,
         "tasks_done": done_tasks,
         "completion_rate": (done_tasks / total_tasks) if total_tasks else 0.0,
     }
 
 
+@app.get("/api/dashboard/summary", response_model=None)
+async def dashboard_summary(workspace_id: str):
+    version = await get_version("dashboard")
+    if version is None:
+        return json_response(orjson.dumps(await compute_dashboard_summary(workspace_id)))
+    key = make_key("dashboard", version, {"workspace_id": workspace_id})
+    payload = await get_cached(key)
+    if payload is None:
+        payload = orjson.dumps(await compute_dashboard_summary(workspace_id))
+        await set_cached(key, payload)
+    return json_response(payload)
+
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=port, loop="uvloop", http="httptools", workers=workers)
@@ -6,11 +6,13 @@ Use these schemas for validation and for the auto database viewer via GET /schem
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from datetime import datetime
 
 
 class User(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str = Field(..., description="Full name")
     email: EmailStr = Field(..., description="Unique email address")
     company: Optional[str] = Field(None, description="Company name (optional)")
@@ -21,6 +23,8 @@ class User(BaseModel):
 
 
 class Workspace(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str = Field(..., description="Workspace name, e.g., Bright Media")
     owner_user_id: str = Field(..., description="Owner user ID")
     member_user_ids: List[str] = Field(default_factory=list, description="Members in workspace")
@@ -28,6 +32,8 @@ class Workspace(BaseModel):
 
 
 class Room(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     workspace_id: str = Field(..., description="Workspace ID")
     name: str = Field(..., description="Room name")
     type: str = Field("online", description="online | in-person | hybrid")
@@ -35,6 +41,8 @@ class Room(BaseModel):
 
 
 class Meeting(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     room_id: str = Field(..., description="Room ID")
     title: str = Field(..., description="Meeting title")
     scheduled_at: datetime = Field(..., description="Scheduled date/time (ISO)")
@@ -46,12 +54,16 @@ class Meeting(BaseModel):
 
 
 class Note(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     meeting_id: str = Field(..., description="Meeting ID")
     author_user_id: str = Field(..., description="Author user ID")
     content: str = Field(..., description="Note content")
 
 
 class Task(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     meeting_id: str = Field(..., description="Meeting ID")
     title: str = Field(..., description="Task title")
     assignee_user_id: Optional[str] = Field(None, description="Assignee user ID")
@@ -60,6 +72,8 @@ class Task(BaseModel):
 
 
 class FileAsset(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     meeting_id: str = Field(..., description="Meeting ID")
     uploaded_by_user_id: str = Field(..., description="Uploader ID")
     name: str = Field(..., description="File name")